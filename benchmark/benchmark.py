@@ -1,11 +1,25 @@
 import argparse
+import hashlib
 import importlib
+import multiprocessing
+import os
+import pickle
+import sys
 
-from benchmark.cache_benchmark import CacheBenchmark
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from benchmark import cache_benchmark
+from benchmark.cache_benchmark import CacheBenchmark, pin_cpu
 from benchmark.visualization import display
 
 
 NUM_CACHES = 4
+SIZES = tuple(256 << (2 * i) for i in range(NUM_CACHES)) # (256, 1024, 4096, 16384)
+
+# Directory storing the results of previous benchmark runs.
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".bench_cache")
 
 
 def initialize_parser() -> argparse.ArgumentParser:
@@ -34,6 +48,17 @@ def parser_add_args(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
         nargs='*',
         help='method(s) to benchmark.'
     )
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        action='store',
+        help='number of benchmark worker processes. defaults to the number of cpus.'
+    )
+    parser.add_argument(
+        "--no-cache",
+        action='store_true',
+        help='re-run the benchmarks even if stored results match the configuration.'
+    )
 
     return parser
 
@@ -45,7 +70,8 @@ def process_args(parser: argparse.ArgumentParser):
         parser (argparse.ArgumentParser): Argument Parser.
 
     Returns:
-        tuple(list, set): List of caches, set of methods.
+        tuple(list, set, int, bool): List of caches, set of methods,
+        number of worker processes, whether to use stored results.
     """
     classes = []
 
@@ -58,7 +84,7 @@ def process_args(parser: argparse.ArgumentParser):
 
     methods = args.method if args.method else None
 
-    return classes, methods
+    return classes, methods, args.workers, not args.no_cache
 
 
 def wrapped_import(module_class_descriptor):
@@ -78,12 +104,12 @@ def wrapped_import(module_class_descriptor):
     return _class
 
 
-def generate_caches(classes: list):
-    """Generate `n=NUM_CACHES` caches for each
-    cache defined in `classes`.
+def generate_caches(classes: list, sizes: tuple=SIZES):
+    """Generate a cache of each size in `sizes`
+    for each cache defined in `classes`.
 
-    By default (bit_mask = 256 and NUM_CACHES = 4),
-    this function generates a set of caches with capacities:
+    By default (NUM_CACHES = 4), this function generates
+    a set of caches with capacities:
 
         {256, 1024, 4096, 16384}
 
@@ -91,57 +117,182 @@ def generate_caches(classes: list):
 
     Args:
         classes (list): List of cache classes to build.
+        sizes (tuple, optional): Cache capacities. Defaults to SIZES.
 
     Returns:
-        dict: Dict mapping UID's to Cache's.
+        list: List of (UID, cache size, cache) records.
     """
-    caches = {}
+    caches = []
 
     for _class in classes:
-        mask = 256  # Bit-Mask
-
-        for _ in range(NUM_CACHES):
-            # uid = f"{_class.__module__}.{_class.__name__}.{mask}"
-            package_class_id = f"{_class.__module__}.{_class.__name__}"
-            _object = _class(mask)
-            if package_class_id not in caches:
-                caches[package_class_id] = {}
-            caches[package_class_id][mask] = _object
-            mask <<= 2
+        package_class_id = f"{_class.__module__}.{_class.__name__}"
+        caches.extend((package_class_id, size, _class(size)) for size in sizes)
 
     return caches
 
 
-def generate_benchmarks(caches: dict, methods: list):
+def generate_benchmarks(caches: list, methods: list):
     """Wrap Cache objects in the `CacheBenchmark` class.
 
     Args:
-        caches (dict): Dictionary of uids:cache_objects.
+        caches (list): List of (UID, cache size, cache) records.
 
     Returns:
-        dict: Dictionary of uids:benchmark_objects.
+        list: List of (UID, cache size, benchmark) records.
     """
-    for package_class_id, c_map in caches.items():
-        for c_size, cache in c_map.items():
-            c_map[c_size] = CacheBenchmark(cache=cache, methods=methods)
+    return [(package_class_id, c_size, CacheBenchmark(cache=cache, methods=methods))
+            for package_class_id, c_size, cache in caches]
 
-    return caches
 
+def _available_cpus():
+    """Returns the cpus this process may run on, in ascending order."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _init_worker(cpus):
+    """Pin each worker process to its own cpu."""
+    pin_cpu(cpus.get())
+
+
+def _compile(benchmark: CacheBenchmark):
+    """Run a single benchmark in a worker process.
+
+    Only the results and statistics are sent back; the
+    populated cache can be too deeply linked to pickle.
+    """
+    benchmark.compile()
+    return benchmark.results, benchmark.statistics
+
+
+def _source_digest(module_name):
+    """Returns a digest of the source of a module's top-level package.
+
+    Every source file of the package is hashed, so a change to any
+    module the cache depends on is detected. A top-level module that
+    is not a package is hashed on its own.
+    """
+    module = sys.modules.get(module_name.partition(".")[0])
+
+    if hasattr(module, "__path__"):
+        # (path relative to the package, path) of each source file.
+        paths = sorted((os.path.relpath(os.path.join(dirpath, filename), root),
+                        os.path.join(dirpath, filename))
+                       for root in module.__path__
+                       for dirpath, _, filenames in os.walk(root)
+                       for filename in filenames if filename.endswith(".py"))
+    elif getattr(module, "__file__", None):
+        paths = [(os.path.basename(module.__file__), module.__file__)]
+    else:
+        return None
+
+    digest = hashlib.blake2b()
+    for name, path in paths:
+        digest.update(name.encode())
+        with open(path, "rb") as source:
+            digest.update(source.read())
+
+    return digest.hexdigest()
+
+
+def _cache_path(caches: list):
+    """Returns the path of the stored results for a configuration.
+
+    The configuration is identified by the benchmarked caches, their
+    sizes and methods, the source of the packages defining the caches
+    and the benchmark itself, and the interpreter and NumPy versions.
+    Changing any of them invalidates the stored results.
+
+    Args:
+        caches (list): List of (UID, cache size, benchmark) records.
+    """
+    modules = {cache_benchmark.__name__}
+    config = []
+
+    for package_class_id, c_size, _object in caches:
+        modules.add(type(_object.cache).__module__)
+        config.append((package_class_id, c_size, tuple(_object.methods)))
+
+    sources = sorted((name, _source_digest(name)) for name in modules)
+    versions = (sys.version, np.__version__)
+    key = hashlib.blake2b(repr((config, sources, versions)).encode(), digest_size=16).hexdigest()
+
+    return os.path.join(CACHE_DIR, f"{key}.pkl")
+
+
+def _run_benchmarks(caches: list, workers: int=None):
+    """Run the benchmarks in a pool of worker processes.
+
+    Args:
+        caches (list): List of (UID, cache size, benchmark) records.
+        workers (int, optional): Number of worker processes.
+        Defaults to the number of cpus.
+
+    Returns:
+        list: (results, statistics) of each benchmark.
+    """
+    workers = max(min(len(caches), workers or os.cpu_count() or 1), 1)
+
+    # Hand out cpus starting from the last one, so the
+    # first worker is isolated from the (usually busier) cpu 0.
+    available = _available_cpus()
+    cpus = multiprocessing.Queue()
+    for i in range(workers):
+        cpus.put(available[-1 - i % len(available)])
+
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_init_worker,
+                             initargs=(cpus,)) as executor:
+        futures = [executor.submit(_compile, _object) for _, _, _object in caches]
+
+        return [future.result() for future in futures]
+
+
+def compile_benchmarks(caches: list, workers: int=None, use_cache: bool=True):
+    """Run the benchmarks.
+
+    Benchmarks share no state and are CPU-bound, so each one
+    is dispatched to a pool of worker processes. Each worker
+    is pinned to its own cpu.
+
+    Results are stored in `CACHE_DIR`. If stored results match
+    the configuration, they are loaded instead of re-running
+    the benchmarks.
+
+    Args:
+        caches (list): List of (UID, cache size, benchmark) records.
+        workers (int, optional): Number of worker processes.
+        Defaults to the number of cpus.
+        use_cache (bool, optional): Load and store results in
+        `CACHE_DIR`. Defaults to True.
+    """
+    path = _cache_path(caches)
+
+    if use_cache and os.path.exists(path):
+        with open(path, "rb") as stored:
+            outcomes = pickle.load(stored)
+    else:
+        outcomes = _run_benchmarks(caches, workers)
+
+        if use_cache:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(path, "wb") as stored:
+                pickle.dump(outcomes, stored)
 
-def compile_benchmarks(caches: dict):
-    """Run the benchmarks. """
-    for package_class_id, c_map in caches.items():
-        for c_size, _object in c_map.items():
-            _object.compile()
+    for (_, _, _object), (_results, _statistics) in zip(caches, outcomes):
+        _object.results.update(_results)
+        _object.statistics.update(_statistics)
 
     return caches
 
 
-arg_parser = initialize_parser()
-parser_add_args(arg_parser)
-cls, mth = process_args(arg_parser)
+if __name__ == "__main__":
+    arg_parser = initialize_parser()
+    parser_add_args(arg_parser)
+    cls, mth, num_workers, cached = process_args(arg_parser)
 
-cache_map = generate_caches(cls)
-cache_map = generate_benchmarks(cache_map, mth)
-results = compile_benchmarks(cache_map)
-display(results)
\ No newline at end of file
+    cache_map = generate_caches(cls)
+    cache_map = generate_benchmarks(cache_map, mth)
+    results = compile_benchmarks(cache_map, num_workers, cached)
+    display(results)
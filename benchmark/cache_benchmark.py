@@ -1,12 +1,62 @@
+import gc
+import os
 import time
-import random
-import statistics
+import warnings
 
 import numpy as np
 
 
 NITERATIONS = 100000 # Number of Get & Delete operations
 NSETS = 20000 # Number of Sets. Ensure NSETS > max cache size to simulate evictions.
+BATCH = 100 # Number of operations timed per sample.
+REPEAT = 7 # Number of delete runs. Each run deletes every item in the cache.
+
+# Timing function generated for each benchmarked statement, modelled
+# on `timeit.template`. `cache`, `keys` and `timer` are arguments, so
+# the timed loop only performs local lookups, and keys are iterated
+# directly rather than drawn through a function call per operation.
+_TEMPLATE = """
+def inner(cache, keys, timer):
+    _t0 = timer()
+    for key in keys:
+        {stmt}
+    return timer() - _t0
+"""
+
+NO_TURBO = "/sys/devices/system/cpu/intel_pstate/no_turbo"
+
+
+def pin_cpu(cpu: int):
+    """Reduce scheduler and frequency jitter for the current process.
+
+    Pins the process to a single cpu, so samples are not disturbed by
+    migrations between cores, and raises its scheduling priority.
+    Both are best-effort: unsupported platforms and insufficient
+    permissions are ignored. Warns if turbo boost is enabled, as
+    frequency drift over a long run is a source of variance; a stable
+    machine should reach a coefficient of variation below 0.5%.
+
+    Args:
+        cpu (int): Index of the cpu to pin to.
+    """
+    if hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, {cpu})
+        except OSError:
+            pass
+
+    if hasattr(os, "nice"):
+        try:
+            os.nice(-10)
+        except PermissionError:
+            pass
+
+    try:
+        with open(NO_TURBO, encoding="utf-8") as no_turbo:
+            if no_turbo.read().strip() != "1":
+                warnings.warn(f"turbo boost is enabled; set {NO_TURBO} to 1 for stable timings.")
+    except OSError:
+        pass
 
 
 class CacheBenchmark:
@@ -19,24 +69,20 @@ class CacheBenchmark:
 
     """
     def __init__(self, cache, methods: list=None):
-        required = ["__getitem__", "__setitem__", "__delitem__"]
-        for func in required:
-            attr = getattr(cache, func, None)
-            if not callable(attr):
+        for func in ("__getitem__", "__setitem__", "__delitem__"):
+            if not hasattr(cache, func):
                 raise AttributeError(f"{cache.__class__} does not implement {func}.")
 
-        self.capacity = None
-        options = ["capacity", "maxsize"]
-        for option in options:
-            if hasattr(cache, option):
-                self.capacity = getattr(cache, option, None)
+        # `capacity` takes precedence over `maxsize`.
+        self.capacity = getattr(cache, "capacity", None) or getattr(cache, "maxsize", None)
         if not self.capacity:
             raise AttributeError(f"{cache.__class__} does not expose `maxsize` or `capacity`.")
 
+        # Per-operation times of each sample, in nanoseconds.
         self._results = {
-                        "get": [],
-                        "set": [],
-                        "delete": []
+                        "get": np.empty(0, dtype=np.float64),
+                        "set": np.empty(0, dtype=np.float64),
+                        "delete": np.empty(0, dtype=np.float64)
                         }
 
         self._statistics = {
@@ -63,6 +109,10 @@ class CacheBenchmark:
     def cache(self):
         return self._cache
 
+    @property
+    def methods(self):
+        return self._methods
+
     def compile(self):
         """Runs selected benchmarks and compiles statistics.
 
@@ -72,32 +122,111 @@ class CacheBenchmark:
                 "delete": self._deletes
                 }
 
+        self._warmup()
+
         for method in self._methods:
             func = mmap[method]
             results = func()
-            self._results[method].extend(results)
+            self._results[method] = np.concatenate((self._results[method], results))
 
         self._generate_statistics()
 
+    def _warmup(self):
+        """Exercise each operation on a throwaway cache.
+
+        Runs set, get and delete operations on a fresh cache of the
+        same type and capacity before any timed region, so one-time
+        costs (lazy imports, first allocations, cold interpreter
+        caches) are not attributed to the benchmarked operations.
+        """
+        warm = type(self.cache)(self.capacity)
+
+        for key in range(self.capacity):
+            warm[key] = key
+        for key in range(self.capacity):
+            _ = warm[key]
+        for key in range(self.capacity):
+            del warm[key]
+
     def _generate_statistics(self):
         """Generate statistics from cache run-times.
 
+        Timing noise only ever adds to a run-time, so the
+        minimum is reported as the primary figure. The
+        median and tail percentiles are kept as auxiliary
+        metrics.
+
         self._statistics:
             {
+            "min": None,
             "median": None,
             "p90": None,
-            "p99": None,
-            "std": None,
-            "var": None
+            "p99": None
             }
         """
         for operation, results in self._results.items():
-            if results:
-                self._statistics[operation]["median"] = statistics.median(results)
-                self._statistics[operation]["p90"] = np.percentile(results, 90)
-                self._statistics[operation]["p99"] = np.percentile(results, 99)
-                self._statistics[operation]["std"] = statistics.stdev(results)
-                self._statistics[operation]["var"] = statistics.variance(results)
+            if len(results):
+                # A single partition places every percentile at
+                # its sorted position, without a full sort.
+                size = results.size
+                ranks = [size // 2, int(size * 0.90), min(size - 1, int(size * 0.99))]
+                partitioned = np.partition(results, ranks)
+
+                self._statistics[operation]["min"] = results.min()
+                self._statistics[operation]["median"] = partitioned[ranks[0]]
+                self._statistics[operation]["p90"] = partitioned[ranks[1]]
+                self._statistics[operation]["p99"] = partitioned[ranks[2]]
+
+    def _time(self, stmt, keys):
+        """Time `stmt` over `keys` in batches.
+
+        The keys are split into batches of `BATCH` keys, the last
+        batch holding any remainder. Each batch is timed as a whole
+        and divided by its own size, amortizing the overhead of the
+        timer over the batch while still yielding a distribution of
+        samples. Batches are timed with
+        `time.perf_counter_ns`, whose integer differences are exact.
+
+        `stmt` is compiled into a timing function generated from
+        `_TEMPLATE`. It refers to the cache as `cache` and to the
+        current key as `key`.
+
+        Args:
+            stmt (str): Statement performing a single cache operation.
+            keys (sequence): Keys consumed by `stmt`, one per operation.
+
+        Returns:
+            np.ndarray: Mean time per-operation of each batch,
+            in nanoseconds.
+        """
+        namespace = {}
+        exec(_TEMPLATE.format(stmt=stmt), namespace) # pylint: disable=exec-used
+        inner = namespace["inner"]
+
+        cache = self.cache
+        timer = time.perf_counter_ns
+        batch = min(BATCH, len(keys))
+
+        # Slice the batches outside of the timed region.
+        batches = [keys[i:i + batch] for i in range(0, len(keys), batch)]
+        sizes = np.array([len(keys_batch) for keys_batch in batches], dtype=np.float64)
+        times = np.empty(len(batches), dtype=np.float64)
+
+        # Collect up front and keep the garbage collector
+        # disabled across every batch, so no collection
+        # lands inside a timed region.
+        gc.collect()
+        gcold = gc.isenabled()
+        gc.disable()
+        try:
+            for i, keys_batch in enumerate(batches):
+                times[i] = inner(cache, keys_batch, timer)
+        finally:
+            if gcold:
+                gc.enable()
+
+        times /= sizes
+        return times
 
     def _gets(self, number=NITERATIONS):
         """Benchmark `get` operations.
@@ -107,72 +236,50 @@ class CacheBenchmark:
             Defaults to NITERATIONS.
 
         """
-        times = []
-
+        cache = self.cache
         cache_size = self.capacity
 
         # Populate Cache with Random Values
         for key in range(cache_size):
-            self.cache[key] = key + 1
+            cache[key] = key
 
-        for _ in range(number):
-            key = random.randrange(cache_size)
-            start = time.perf_counter()
-            val = self.cache[key]
-            end = time.perf_counter()
-            elapsed = end - start
+        # Draw the keys up front so random number generation
+        # is kept out of the timed region.
+        keys = np.random.randint(0, cache_size, size=number).tolist()
 
-            times.append(elapsed)
-
-        return times
+        return self._time("cache[key]", keys)
 
     def _sets(self, number=NSETS):
         """Benchmark `set` operations.
 
         Args:
             number (int, optional): Number of iterations.
-            Defaults to NITERATIONS.
+            Defaults to NSETS.
 
-        Returns:
-            _type_: _description_
         """
-        times = []
-
-        for key in range(number):
-            value = key + 1
-            start = time.perf_counter()
-            self.cache[key] = value
-            end = time.perf_counter()
-            elapsed = end - start
-
-            times.append(elapsed)
-
-        return times
+        # Each key is stored as its own value, so the timed
+        # statement allocates no new value object.
+        return self._time("cache[key] = key", range(number))
 
     def _deletes(self):
         """Benchmark `delete` operations.
 
-        Args:
-            number (int, optional): Number of iterations.
-            Defaults to NITERATIONS.
+        The cache is populated and then emptied `REPEAT` times.
 
-        Returns:
-            _type_: _description_
         """
-        times = []
-
+        cache = self.cache
         cache_size = self.capacity
 
-        # Populate Cache
-        for i in range(cache_size):
-            self.cache[i] = i + 1
+        # One row of batch samples per run, including
+        # the trailing partial batch.
+        batch = min(BATCH, cache_size)
+        times = np.empty((REPEAT, -(-cache_size // batch)), dtype=np.float64)
 
-        for key in range(cache_size):
-            start = time.perf_counter()
-            del self.cache[key]
-            end = time.perf_counter()
-            elapsed = end - start
+        for run in range(REPEAT):
+            # Populate Cache
+            for i in range(cache_size):
+                cache[i] = i
 
-            times.append(elapsed)
+            times[run] = self._time("del cache[key]", range(cache_size))
 
-        return times
+        return times.ravel()
@@ -1,63 +1,67 @@
+import numpy as np
 import pandas as pd
 
 
-def build_dataframe(results: dict):
+COLUMNS = ("library", "cache_type", "cache_size", "min", "median", "p90", "p99")
+
+
+def build_dataframe(results: list):
     """Constructs dataframe from transformed data.
 
     Args:
-        results (dict): Transformed data yielded from `transform_data()`.
+        results (list): Transformed data yielded from `transform_data()`.
     """
     bar_chart_data = {"set": [], "get": [], "delete": []}
 
-    for cache_name, data in results.items():
-        cache_type = cache_name.split(".")[-1]
-        library = cache_name.rsplit(".",1)[0]
-        for cache_size, statistics in data.items():
-            for method, stats in statistics.items():
-                if stats:
-                    bar_chart_entry = {"library": library, 
-                                       "cache_type": cache_type,
-                                       "cache_size": cache_size,
-                                       "median": stats["median"],
-                                       "p90": stats["p90"],
-                                       "p99": stats["p99"]}
-                    bar_chart_data[method].append(bar_chart_entry)
-
-    df_set = pd.DataFrame.from_dict(bar_chart_data["set"])
-    df_get = pd.DataFrame.from_dict(bar_chart_data["get"])
-    df_delete = pd.DataFrame.from_dict(bar_chart_data["delete"])
+    for cache_name, cache_size, statistics in results:
+        library, cache_type = cache_name.rsplit(".", 1)
+        for method, stats in statistics.items():
+            if stats:
+                bar_chart_data[method].append((library,
+                                               cache_type,
+                                               cache_size,
+                                               stats["min"],
+                                               stats["median"],
+                                               stats["p90"],
+                                               stats["p99"]))
+
+    df_set = pd.DataFrame(bar_chart_data["set"], columns=COLUMNS)
+    df_get = pd.DataFrame(bar_chart_data["get"], columns=COLUMNS)
+    df_delete = pd.DataFrame(bar_chart_data["delete"], columns=COLUMNS)
 
     print("Set: \n", df_set)
     print("Get: \n", df_get)
     print("Delete: \n", df_delete)
 
 
-def transform_data(cache_results: dict):
-    """Normalize values to microseconds (1 millionth of a second).
+def transform_data(cache_results: list):
+    """Normalize values from nanoseconds to microseconds (1 millionth of a second).
 
     Args:
-        cache_results (dict): Cache results yielded from
-        `benchmark.compile_benchmarks()`.
+        cache_results (list): List of (UID, cache size, benchmark)
+        records yielded from `benchmark.compile_benchmarks()`.
+
+    Returns:
+        list: List of (UID, cache size, statistics) records.
     """
-    transformed_data = {}
+    transformed_data = []
 
-    for cache_type, cache_map in cache_results.items():
-        transformed_data[cache_type] = {}
-        for cache_size, cache_object in cache_map.items():
-            transformed_data[cache_type][cache_size] = {"get": {}, "set": {}, "delete": {}}
-            for method, stat_sum in cache_object.statistics.items():
-                inner = {stat_name: stat*1000000 for stat_name, stat in stat_sum.items()}
-                transformed_data[cache_type][cache_size][method] = inner
+    for cache_type, cache_size, cache_object in cache_results:
+        inner = {}
+        for method, stat_sum in cache_object.statistics.items():
+            stats = np.fromiter(stat_sum.values(), dtype=np.float64, count=len(stat_sum))
+            inner[method] = dict(zip(stat_sum.keys(), (stats / 1000).tolist()))
+        transformed_data.append((cache_type, cache_size, inner))
 
     return transformed_data
 
 
-def display(cache_results: dict):
+def display(cache_results: list):
     """Build and display results.
 
     Args:
-        cache_results (dict): Cache results yielded from
-        `benchmark.compile_benchmarks()`.
+        cache_results (list): List of (UID, cache size, benchmark)
+        records yielded from `benchmark.compile_benchmarks()`.
     """
     transformed_results = transform_data(cache_results=cache_results)
     build_dataframe(transformed_results)
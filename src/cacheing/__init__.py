@@ -14,16 +14,22 @@ Licensed under MIT.
 import random
 import time
 
-from collections import OrderedDict, Counter
-from collections.abc import MutableMapping, Iterable, KeysView, ItemsView, ValuesView
-from typing import List
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from heapq import heapify, heappop, heappush
 
-from .utils import (
-    _TTLLink,
-    _TTLLinkedList,
-    LFULinkedList,
-    LFUNode
-    )
+from .utils import LFULinkedList
+
+# Bound once at import, so picking a random key to
+# evict does not look `randrange` up on the module.
+_randrange = random.randrange
+
+# Number of TTL's drawn at once by `BoundedTTLCache`.
+_TTL_BATCH = 1024
+
+# Sentinel default for `pop`, distinct from any value
+# a caller could pass.
+_MISSING = object()
 
 __all__ = (
     "RCache",
@@ -51,33 +57,27 @@ class RCache(MutableMapping):
         behaviour when an item is evicted from the cache.
         Defaults to None.
     """
-    __singleton = object()
+    __slots__ = ('_cache', '_capacity', '_callback', '__weakref__')
 
     def __init__(self, capacity, callback=None):
-        self.__cache = {}
+        self._cache = {}
 
-        self.__size = 0 # Number of Items in the Cache
-        self.__capacity = capacity
+        self._capacity = capacity
         self._callback = callback
 
     @property
     def capacity(self):
-        return self.__capacity
+        return self._capacity
 
     def __setitem__(self, _key, _value):
-        if _key not in self.__cache:
-            while self.__size >= self.__capacity:
+        cache = self._cache
+        if _key not in cache:
+            while len(cache) >= self._capacity:
                 self._evict()
-            self.__cache[_key] = _value
-            self.__size += 1
-        else:
-            self.__cache[_key] = _value
+        cache[_key] = _value
 
     def __getitem__(self, _key):
-        try:
-            return self.__cache[_key]
-        except KeyError:
-            raise KeyError(_key) from None
+        return self._cache[_key]
 
     def get(self, _key, _default=None):
         try:
@@ -86,15 +86,14 @@ class RCache(MutableMapping):
             return _default
 
     def __delitem__(self, _key):
-        del self.__cache[_key]
-        self.__size -= 1
+        del self._cache[_key]
 
-    def pop(self, _key, default=__singleton):
+    def pop(self, _key, default=_MISSING):
         try:
             _value = self[_key]
             del self[_key]
         except KeyError:
-            if default is self.__singleton:
+            if default is _MISSING:
                 raise
             return default
         else:
@@ -103,11 +102,10 @@ class RCache(MutableMapping):
     def popitem(self):
         """Pop the most recent item from the cache."""
         try:
-            itm = self.__cache.popitem()
+            itm = self._cache.popitem()
         except KeyError:
             raise KeyError("cache is empty") from None
         else:
-            self.__size -= 1
             return itm
 
     def _evict(self):
@@ -118,13 +116,11 @@ class RCache(MutableMapping):
             KeyError: Cache is empty.
         """
         try:
-            key = next(iter(self))
+            key = next(iter(self._cache))
         except StopIteration:
             raise KeyError("cache is empty") from None
 
-        value = self[key]
-        del self.__cache[key]
-        self.__size -= 1
+        value = self._cache.pop(key)
 
         if self._callback:
             self._callback(key, value)
@@ -132,30 +128,30 @@ class RCache(MutableMapping):
         return key, value
 
     def __contains__(self, _key):
-        return _key in self.__cache
+        return _key in self._cache
 
     def __iter__(self):
-        return iter(self.__cache)
+        return iter(self._cache)
 
     def __len__(self):
-        return len(self.__cache)
+        return len(self._cache)
 
     def __repr__(self):
-        return "{}{}".format(self.__class__.__name__, self.__cache)
+        return "{}{}".format(self.__class__.__name__, dict(self._cache))
 
     def keys(self):
-        return self.__cache.keys()
+        return self._cache.keys()
 
     def values(self):
-        return self.__cache.values()
+        return self._cache.values()
 
     def items(self):
-        return self.__cache.items()
+        return self._cache.items()
 
     def __eq__(self, obj):
         if isinstance(obj, RCache):
-            if self.__dict__ == obj.__dict__:
-                return True
+            return ((self._capacity, self._callback, self._cache) ==
+                    (obj._capacity, obj._callback, obj._cache))
         return False
 
 
@@ -170,43 +166,39 @@ class VolatileCache:
         behaviour when an item is evicted from the cache.
         Defaults to None.
     """
-    __singleton = object()
+    __slots__ = ('_cache', '_capacity', '_callback', '_expires_map', '__weakref__')
 
     def __init__(self, capacity, callback=None):
-        self.__cache = {}
+        self._cache = {}
 
-        self.__size = 0
-        self.__capacity = capacity
+        self._capacity = capacity
         self._callback = callback
 
-        # Dict containing items which expire
+        # Ordered set of the keys which expire, stored as
+        # dict keys. Values are not duplicated here.
         self._expires_map = {}
 
     @property
     def capacity(self):
-        return self.__capacity
+        return self._capacity
 
     def __setitem__(self, _keymeta, _value):
         _key, expires = _keymeta
 
-        if _key not in self.__cache:
-            while self.__size >= self.__capacity and self._expires_map:
+        if _key not in self._cache:
+            while len(self._cache) >= self._capacity and self._expires_map:
                 self._evict()
-            if self.__size < self.__capacity: # Otherwise, new data item is discarded
-                self.__cache[_key] = _value
+            if len(self._cache) < self._capacity: # Otherwise, new data item is discarded
+                self._cache[_key] = _value
                 if expires:
-                    self._expires_map[_key] = _value
-                self.__size += 1
+                    self._expires_map[_key] = None
         else:
-            self.__cache[_key] = _value
+            self._cache[_key] = _value
             if expires:
-                self._expires_map[_key] = _value
+                self._expires_map[_key] = None
 
     def __getitem__(self, _key):
-        try:
-            return self.__cache[_key]
-        except KeyError:
-            raise KeyError(_key) from None
+        return self._cache[_key]
 
     def get(self, _key, _default=None):
         """If key does not exist in the cache, returns default.
@@ -221,25 +213,25 @@ class VolatileCache:
             return _default
 
     def __delitem__(self, _key):
-        del self.__cache[_key]
+        del self._cache[_key]
         self._expires_map.pop(_key, None)
-        self.__size -= 1
 
-    def pop(self, _key, default=__singleton):
-        """_summary_
+    def pop(self, _key, default=_MISSING):
+        """Remove an item from the cache and return its value.
 
         Args:
-            _key (_type_): _description_
-            default (_type_, optional): _description_. Defaults to __singleton.
+            _key (hashable): Item key.
+            default (object, optional): Returned if the key does
+            not exist in the cache. If not given, raises KeyError.
 
         Returns:
-            _type_: _description_
+            object: Item value.
         """
         try:
             _value = self[_key]
             del self[_key]
         except KeyError:
-            if default is self.__singleton:
+            if default is _MISSING:
                 raise
             return default
         else:
@@ -248,12 +240,11 @@ class VolatileCache:
     def popitem(self):
         """Pop the most recent item from the cache."""
         try:
-            key, value = self.__cache.popitem()
+            key, value = self._cache.popitem()
             self._expires_map.pop(key, None)
         except KeyError:
             raise KeyError("cache is empty") from None
         else:
-            self.__size -= 1
             return (key, value)
 
     def _evict(self):
@@ -268,10 +259,8 @@ class VolatileCache:
         except StopIteration:
             raise KeyError("no candidate keys available to evict") from None
 
-        value = self[key]
-        del self.__cache[key]
+        value = self._cache.pop(key)
         del self._expires_map[key]
-        self.__size -= 1
 
         if self._callback:
             return self._callback(key, value)
@@ -279,45 +268,53 @@ class VolatileCache:
         return key, value
 
     def __contains__(self, _key):
-        return _key in self.__cache
+        return _key in self._cache
 
     def __iter__(self):
-        return iter(self.__cache)
+        return iter(self._cache)
 
     def __len__(self):
-        return len(self.__cache)
+        return len(self._cache)
 
     def __repr__(self):
-        return "{}{}".format(self.__class__.__name__, self.__cache)
+        return "{}{}".format(self.__class__.__name__, self._cache)
 
     def keys(self):
-        return self.__cache.keys()
+        return self._cache.keys()
 
     def values(self):
-        return self.__cache.values()
+        return self._cache.values()
 
     def items(self):
-        return self.__cache.items()
+        return self._cache.items()
 
     def __eq__(self, obj):
-        if isinstance(obj, VolatileCache):
-            if self.__dict__ == obj.__dict__:
-                return True
-        return False
+        if self is obj:
+            return True
+        if type(obj) is not type(self):
+            return NotImplemented
+        return ((self._capacity, self._callback, self._cache, self._expires_map) ==
+                (obj._capacity, obj._callback, obj._cache, obj._expires_map))
 
 
 class LRUCache(RCache):
     """Least Recently Used Cache.
 
+    The backing `OrderedDict` holds items in LRU order:
+    the least-recently used item is at the front, and
+    the most-recently used item is at the back.
+
     Attributes:
         capacity (int): Maximum capacity of the cache.
         callback (callable, optional): Callable defining
         behaviour when an item is evicted from the cache.
         Defaults to None.
     """
+    __slots__ = ()
+
     def __init__(self, capacity, callback=None):
         RCache.__init__(self, capacity, callback)
-        self._lru = OrderedDict()
+        self._cache = OrderedDict()
 
     def __getitem__(self, _key):
         """Retrieves item from the cache.
@@ -328,13 +325,26 @@ class LRUCache(RCache):
         Args:
             _key (hashable): Key.
         """
-        try:
-            _value = RCache.__getitem__(self, _key)
-        except KeyError:
-            raise KeyError from None
-        else:
-            self._lru.move_to_end(_key, last=False)
-            return _value
+        _value = self._cache[_key]
+        self._cache.move_to_end(_key)
+        return _value
+
+    def get(self, _key, _default=None):
+        """If key does not exist in the cache, returns default.
+
+        Checks membership up front rather than catching
+        the `KeyError` raised by a miss.
+
+        Args:
+            _key (hashable): Item key.
+            _default (object, optional): Defaults to None.
+        """
+        cache = self._cache
+        if _key not in cache:
+            return _default
+
+        cache.move_to_end(_key)
+        return cache[_key]
 
     def __setitem__(self, _key, _value):
         """Add item to the cache..
@@ -347,25 +357,25 @@ class LRUCache(RCache):
             _key (hashable): Item Key.
             _value (object): Item Value.
         """
-        RCache.__setitem__(self, _key, _value)
-        self._lru[_key] = _value
+        cache = self._cache
 
-        # Update LRU Ordering
-        self._lru.move_to_end(_key, last=False)
-
-    def __delitem__(self, _key):
-        RCache.__delitem__(self, _key)
-        del self._lru[_key]
+        if _key in cache:
+            cache[_key] = _value
+            # Update LRU Ordering
+            cache.move_to_end(_key)
+        else:
+            while len(cache) >= self._capacity:
+                self._evict()
+            # New items are inserted at the back,
+            # already in LRU order.
+            cache[_key] = _value
 
     def popitem(self):
         """Force eviction of least-recently used item."""
         try:
-            _key, _value = self._lru.popitem()
+            return self._cache.popitem(last=False)
         except KeyError:
             raise KeyError("cannot pop from empty cache") from None
-        else:
-            RCache.__delitem__(self, _key)
-            return (_key, _value)
 
     def _evict(self):
         """Evict the least-recently used item.
@@ -398,15 +408,22 @@ class VolatileLRUCache(VolatileCache):
     If the cache capacity is reached and there are no
     keys to expire, new data is discarded.
 
+    The ordered set of expiring keys is an `OrderedDict`
+    kept in LRU order, so it doubles as the LRU list: the
+    least-recently used key is at the front, and the
+    most-recently used key is at the back.
+
     Attributes:
         capacity (int): Maximum capacity of the cache.
         callback (callable, optional): Callable defining
         behaviour when an item is evicted from the cache.
         Defaults to None.
     """
+    __slots__ = ()
+
     def __init__(self, capacity, callback=None):
         VolatileCache.__init__(self, capacity, callback)
-        self._lru = OrderedDict()
+        self._expires_map = OrderedDict()
 
     def __setitem__(self, _keymeta, _value):
         """Set an item in the cache.
@@ -424,11 +441,10 @@ class VolatileLRUCache(VolatileCache):
 
         VolatileCache.__setitem__(self, _keymeta, _value)
 
-        if _expires:
-            self._lru[_key] = _value
-
+        # Skip new items discarded by a full cache.
+        if _expires and _key in self._expires_map:
             # Update LRU Ordering
-            self._lru.move_to_end(_key, last=False)
+            self._expires_map.move_to_end(_key)
 
     def __getitem__(self, _key):
         """Retrieves item and updates it's priority.
@@ -436,19 +452,10 @@ class VolatileLRUCache(VolatileCache):
         Args:
             _key (object): Key.
         """
-        try:
-            _value = VolatileCache.__getitem__(self, _key)
-        except KeyError:
-            raise KeyError from None
-        else:
-            if self._expires_map.get(_key): # Key Expires
-                self._lru.move_to_end(_key, last=False)
-            return _value
-
-    def __delitem__(self, _key):
-        VolatileCache.__delitem__(self, _key)
-        if self._lru[_key]:
-            del self._lru[_key]
+        _value = self._cache[_key]
+        if _key in self._expires_map: # Key Expires
+            self._expires_map.move_to_end(_key)
+        return _value
 
     def popitem(self):
         """Pop non-persistent LRU item from the cache.
@@ -456,14 +463,13 @@ class VolatileLRUCache(VolatileCache):
         If no candidate keys are available, raises KeyError.
         """
         try:
-            _key, _value = self._lru.popitem()
+            _key, _ = self._expires_map.popitem(last=False)
         except KeyError:
             # Cache is at full-capacity and there are
             # no candidate keys to pop.
             raise KeyError("no candidate keys") from None
         else:
-            VolatileCache.__delitem__(self, _key)
-            return (_key, _value)
+            return (_key, self._cache.pop(_key))
 
     def _evict(self):
         try:
@@ -490,29 +496,40 @@ class LFUCache(RCache):
         behaviour when an item is evicted from the cache.
         Defaults to None.
     """
+    __slots__ = ('_lfu', 'node_cache')
+
     def __init__(self, capacity, callback=None):
         RCache.__init__(self, capacity=capacity, callback=callback)
 
-        self.__lfu = LFULinkedList()
-        self.node_cache = self.__lfu.node_cache
+        self._lfu = LFULinkedList()
+        self.node_cache = self._lfu.node_cache
+
+    def __getstate__(self):
+        # `node_cache` is rebuilt by `_lfu`, rather than
+        # pickled by walking its linked items.
+        return (self._cache, self._capacity, self._callback, self._lfu)
+
+    def __setstate__(self, state):
+        self._cache, self._capacity, self._callback, self._lfu = state
+        self.node_cache = self._lfu.node_cache
 
     def __setitem__(self, _key, _value):
         RCache.__setitem__(self, _key, _value)
 
         if _key in self.node_cache:
-            self.__lfu.increment(_key)
+            self._lfu.increment(_key)
         else:
-            self.__lfu.insert(_key)
+            self._lfu.insert(_key)
 
     def __getitem__(self, _key):
-        _value = RCache.__getitem__(self, _key)
-        self.__lfu.increment(_key)
+        _value = self._cache[_key]
+        self._lfu.increment(_key)
 
         return _value
 
     def __delitem__(self, _key):
         RCache.__delitem__(self, _key)
-        self.__lfu.delete(_key)
+        self._lfu.delete(_key)
 
     def popitem(self):
         """Force eviction of LFU item.
@@ -520,8 +537,8 @@ class LFUCache(RCache):
         Returns:
             tuple: LFU item key, value pair.
         """
-        key = self.__lfu.popleft()
-        value = RCache.__getitem__(self, key)
+        key = self._lfu.popleft()
+        value = self._cache[key]
         RCache.__delitem__(self, key)
         return (key, value)
 
@@ -543,10 +560,23 @@ class VolatileLFUCache(VolatileCache):
         behaviour when an item is evicted from the cache.
         Defaults to None.
     """
+    __slots__ = ('_lfu', 'node_cache')
+
     def __init__(self, capacity, callback=None):
         VolatileCache.__init__(self, capacity, callback)
-        self.__lfu = LFULinkedList()
-        self.node_cache = self.__lfu.node_cache
+        self._lfu = LFULinkedList()
+        self.node_cache = self._lfu.node_cache
+
+    def __getstate__(self):
+        # `node_cache` is rebuilt by `_lfu`, rather than
+        # pickled by walking its linked items.
+        return (self._cache, self._capacity, self._callback,
+                self._expires_map, self._lfu)
+
+    def __setstate__(self, state):
+        (self._cache, self._capacity, self._callback,
+         self._expires_map, self._lfu) = state
+        self.node_cache = self._lfu.node_cache
 
     def __setitem__(self, _keymeta, _value):
         _key, _expires = _keymeta
@@ -561,22 +591,22 @@ class VolatileLFUCache(VolatileCache):
         # and it's expiry is CHANGED to False, remove
         # it from the LFU stream:
         if _key in self.node_cache and not _expires:
-            self.__lfu.delete(_key)
+            self._lfu.delete(_key)
 
         # Otherwise, increment it's access frequency:
         elif _key in self.node_cache and _expires:
-            self.__lfu.increment(_key)
+            self._lfu.increment(_key)
 
         # If the item does not exist, and it's expiry is
         # set to True - insert it into the linked list:
         elif _key not in self.node_cache and _expires:
-            self.__lfu.insert(_key)
+            self._lfu.insert(_key)
 
     def __getitem__(self, _key):
-        _value = VolatileCache.__getitem__(self, _key)
+        _value = self._cache[_key]
 
         if _key in self.node_cache:
-            self.__lfu.increment(_key)
+            self._lfu.increment(_key)
 
         return _value
 
@@ -584,15 +614,15 @@ class VolatileLFUCache(VolatileCache):
         VolatileCache.__delitem__(self, _key)
 
         if _key in self.node_cache:
-            self.__lfu.delete(_key)
+            self._lfu.delete(_key)
 
     def popitem(self):
         # If there's no items to expire, return None
         if not self._expires_map:
             return (None, None)
 
-        _key = self.__lfu.popleft()
-        _value = VolatileCache.__getitem__(self, _key)
+        _key = self._lfu.popleft()
+        _value = self._cache[_key]
         VolatileCache.__delitem__(self, _key)
         return (_key, _value)
 
@@ -612,6 +642,8 @@ class RandomCache(RCache):
         behaviour when an item is evicted from the cache.
         Defaults to None.
     """
+    __slots__ = ('set', 'idx_map')
+
     def __init__(self, capacity, callback=None):
         RCache.__init__(self, capacity, callback)
 
@@ -632,27 +664,27 @@ class RandomCache(RCache):
         RCache.__delitem__(self, _key)
         # In order to perform a deletion without having
         # to decrement each element of `idx_map`, we
-        # swap the last element of `set` with the element
-        # to be deleted, and replace its index in `idx_map`.
-        last_elem = self.set[-1]
-        index = self.idx_map[_key]
-        ssize = len(self.set) - 1
+        # pop the last element of `set` and move it into
+        # the deleted element's slot, unless the deleted
+        # element was the last one.
+        keys = self.set
+        idx_map = self.idx_map
 
-        if index < ssize:
-            self.set[index] = last_elem
-            self.idx_map[last_elem] = index
+        index = idx_map.pop(_key)
+        last_elem = keys.pop()
 
-        self.set.pop()
-        del self.idx_map[_key]
+        if index < len(keys):
+            keys[index] = last_elem
+            idx_map[last_elem] = index
 
     def popitem(self):
         """Force Eviction of Random item."""
         try:
             _key = self.__get_rand_key()
-        except:
+        except ValueError: # `randrange(0)`, the cache is empty.
             raise KeyError("cannot pop from empty cache") from None
         else:
-            _val = RCache.__getitem__(self, _key)
+            _val = self._cache[_key]
             del self[_key]
             return (_key, _val)
 
@@ -664,7 +696,7 @@ class RandomCache(RCache):
 
     def __get_rand_key(self):
         """Generate a random key from the cache."""
-        return random.choice(self.set)
+        return self.set[_randrange(len(self.set))]
 
 
 class VolatileRandomCache(VolatileCache):
@@ -676,6 +708,8 @@ class VolatileRandomCache(VolatileCache):
         behaviour when an item is evicted from the cache.
         Defaults to None.
     """
+    __slots__ = ('_set', 'idx_map')
+
     def __init__(self, capacity, callback=None):
         VolatileCache.__init__(self, capacity, callback)
 
@@ -698,28 +732,28 @@ class VolatileRandomCache(VolatileCache):
         VolatileCache.__delitem__(self, _key)
         # In order to perform a deletion without having
         # to iteratively decrement each element of `idx_map`,
-        # we swap the last element of `set` with the element
-        # to be deleted, and then pop the last element from `set`.
-        if _key in self.idx_map:
-            last_elem = self._set[-1]
-            index = self.idx_map[_key]
-            ssize = len(self._set) - 1
+        # we pop the last element of `set` and move it into
+        # the deleted element's slot, unless the deleted
+        # element was the last one.
+        idx_map = self.idx_map
+        index = idx_map.pop(_key, None)
 
-            if index < ssize:
-                self._set[index] = last_elem
-                self.idx_map[last_elem] = index
+        if index is not None:
+            keys = self._set
+            last_elem = keys.pop()
 
-            self._set.pop()
-            del self.idx_map[_key]
+            if index < len(keys):
+                keys[index] = last_elem
+                idx_map[last_elem] = index
 
     def popitem(self):
         """Force Eviction of Random item."""
         try:
             _key = self.__get_rand_key()
-        except:
+        except ValueError: # `randrange(0)`, the cache is empty.
             raise KeyError("cannot pop from empty cache") from None
         else:
-            _val = VolatileCache.__getitem__(self, _key)
+            _val = self._cache[_key]
             del self[_key]
             return (_key, _val)
 
@@ -733,10 +767,101 @@ class VolatileRandomCache(VolatileCache):
         """Generate a random key from the cache.
 
         """
-        return random.choice(self._set)
+        return self._set[_randrange(len(self._set))]
 
 
-class TTLCache(LRUCache):
+class _TTLExpiry:
+    """Expiry heap shared by the TTL caches.
+
+    Subclasses declare the `_time`, `_ttl`, `_expiry`,
+    `_heap` and `_seq` slots, and set `_delete_expired`
+    to the `__delitem__` of the cache class that stores
+    their items, which removes an expired key.
+    """
+    __slots__ = ()
+
+    _delete_expired = None
+
+    def _init_expiry(self, _time, ttl):
+        """Initialize the clock, TTL and expiry heap.
+
+        Args:
+            _time (callable): Callable time function.
+            ttl (int): Cache items time-to-live.
+        """
+        self._time = _time
+        self._ttl = ttl
+
+        # Dict mapping expiring keys to their expiry times.
+        self._expiry = {}
+
+        # Min-heap of (expiry, sequence, key) entries. The key
+        # with the nearest expiry time is at the top of the heap.
+        # Entries of deleted or re-set keys are left in the heap
+        # and discarded when they reach the top. The sequence number
+        # breaks ties between equal expiry times, so keys are never
+        # compared. It is a plain int, so the cache pickles without
+        # relying on `itertools` pickle support.
+        self._heap = []
+        self._seq = 0
+
+    def _purge(self, now):
+        """Removes expired keys from the cache.
+
+        Pops entries from the top of the heap until the
+        nearest expiry time is in the future. Callers check
+        the top of the heap first, so it is only called
+        when something has expired.
+
+        Args:
+            now (float): Current time.
+        """
+        heap = self._heap
+        expiry = self._expiry
+        delitem = self._delete_expired
+
+        while heap and heap[0][0] <= now:
+            _expiry, _, _key = heappop(heap)
+            # Skip stale entries of deleted or re-set keys.
+            if expiry.get(_key) == _expiry:
+                del expiry[_key]
+                delitem(_key)
+
+    def _expire(self):
+        """Removes expired keys from the cache, if any.
+
+        Reads the clock only when the heap holds entries,
+        and only calls `_purge` when the nearest expiry
+        time has passed.
+        """
+        heap = self._heap
+        if heap:
+            now = self._time()
+            if heap[0][0] <= now: # Something has expired
+                self._purge(now)
+
+    def _set_expiry(self, _key, expiry):
+        """Set the expiry time of a key.
+
+        Args:
+            _key (hashable): Item Key.
+            expiry (float): Item Expiry Time.
+        """
+        self._expiry[_key] = expiry
+        self._seq += 1
+        heappush(self._heap, (expiry, self._seq, _key))
+
+        # Rebuild the heap once stale entries outnumber live
+        # ones, so re-setting keys cannot grow it without bound.
+        # Every old entry is dropped, so numbering restarts.
+        if len(self._heap) > 2 * len(self._expiry):
+            self._heap = [(_expiry, seq, key)
+                          for seq, (key, _expiry) in enumerate(self._expiry.items())]
+            self._seq = len(self._heap)
+            heapify(self._heap)
+
+
+class TTLCache(_TTLExpiry, LRUCache):
     """TTL cache with global object fixed expiry times.
 
     Monotonic time is used to track key expiry times.
@@ -750,141 +875,74 @@ class TTLCache(LRUCache):
         time (callable): Callable time function used by the
         cache.
     """
-    def __init__(self, capacity, ttl, callback=None, _time=time.monotonic):
-        LRUCache.__init__(self, capacity, callback)
-
-        self._time = _time
-        self.__ttl = ttl
-
-        # Dict Mapping Keys to `_TTLLinks`
-        # this is primarily used for O(1)
-        # lookup and deletions of `_TTLLinks`
-        self._links = {}
-
-        # Linked List of '_TTLLinks'
-        # The linked list is 'sorted' in time-ascending
-        # order. The key with the nearest expiry time is
-        # at the front of the list.
-        self._list = _TTLLinkedList()
-
-    def expire(_time):
-        """Removes expired keys from the cache.
-
-        Decorator for class methods. Iterates over the linked
-        list and removes expired keys from the cache when
-        the cache is accessed.
-        """
-        def wrap(func):
+    __slots__ = ('_time', '_ttl', '_expiry', '_heap', '_seq')
 
-            def wrapped_f(self, *args):
-                curr = self._list.head
+    _delete_expired = LRUCache.__delitem__
 
-                while curr:
-                    if curr.expiry <= _time():
-                        LRUCache.__delitem__(self, curr.key)
-                        self._list.remove(curr)
-                        del self._links[curr.key]
-                        curr = curr.next
-                    else:
-                        return func(self, *args)
+    def __init__(self, capacity, ttl, callback=None, _time=time.monotonic):
+        LRUCache.__init__(self, capacity, callback)
 
-                return func(self, *args)
-            return wrapped_f
-        return wrap
+        _TTLExpiry._init_expiry(self, _time, ttl)
 
-    @expire(_time=time.monotonic)
     def __setitem__(self, _key, _value):
-        LRUCache.__setitem__(self, _key, _value)
-        try:
-            link = self._links[_key]
-        except KeyError:
-            expiry = self._time() + self.__ttl
-            self._links[_key] = link = _TTLLink(_key, expiry, None, None)
-        else:
-            self._list.remove(link)
-            expiry = self._time() + self.__ttl
-            link.expiry = expiry
+        now = self._time()
+        heap = self._heap
+        if heap and heap[0][0] <= now: # Something has expired
+            self._purge(now)
 
-        self._list.insert(link)
+        LRUCache.__setitem__(self, _key, _value)
+        self._set_expiry(_key, now + self._ttl)
 
-    @expire(_time=time.monotonic)
     def __getitem__(self, _key):
-        try:
-            _value = LRUCache.__getitem__(self, _key)
-        except KeyError:
-            raise KeyError(f"{_key}") from None
-        else:
-            return _value
+        self._expire()
+
+        _value = self._cache[_key]
+        self._cache.move_to_end(_key) # Update LRU Ordering
+        return _value
 
-    @expire(_time=time.monotonic)
     def get(self, _key, _default=None):
-        try:
-            return self[_key]
-        except KeyError:
+        self._expire()
+
+        cache = self._cache
+        if _key not in cache:
             return _default
 
-    @expire(_time=time.monotonic)
+        cache.move_to_end(_key)
+        return cache[_key]
+
     def __delitem__(self, _key):
-        try:
-            LRUCache.__delitem__(self, _key)
-        except KeyError:
-            raise KeyError(f"{_key}") from None
-        else:
-            link = self._links[_key]
-            self._list.remove(link)
-            del self._links[_key]
+        self._expire()
+        LRUCache.__delitem__(self, _key)
+        del self._expiry[_key]
 
-    @expire(_time=time.monotonic)
     def __contains__(self, _object: object):
+        self._expire()
         return RCache.__contains__(self, _object)
 
-    @expire(_time=time.monotonic)
     def __iter__(self):
+        self._expire()
         return RCache.__iter__(self)
 
-    @expire(_time=time.monotonic)
     def __len__(self):
+        self._expire()
         return RCache.__len__(self)
 
-    def _evict(self):
-        """Handle evictions when Cache exceeds capacity.
-        Not time-related.
-
-        Invokes callback function whenever an item is evicted.
-
-        """
-        # Fetch and Evict LRU Item from LRUCache
-        _key, _value = LRUCache.popitem(self)
-
-        # Remove References to Link
-        link = self._links[_key]
-        self._list.remove(link)
-        del self._links[_key]
-
-        if self._callback:
-            self._callback(_key, _value)
-
-    @expire(_time=time.monotonic)
     def __str__(self):
+        self._expire()
         return RCache.__repr__(self)
 
     def popitem(self):
-        """Evict the LRU item."""
-        # Fetch and Evict LRU Item from LRUCache
-        _key, _value = LRUCache.popitem(self)
-
-        # Remove References to Link
-        link = self._links[_key]
-        self._list.remove(link)
-        del self._links[_key]
+        """Evict the LRU item.
 
-    # Enable 'expire' decorator to be accessed
-    # outside of the scope of the class, while
-    # still being inside the class namespace.
-    expire = staticmethod(expire)
+        Called by `LRUCache._evict` when the cache
+        exceeds capacity. Not time-related.
+        """
+        _key, _value = LRUCache.popitem(self)
+        del self._expiry[_key]
+        return (_key, _value)
 
 
-class VolatileTTLCache(VolatileLRUCache):
+class VolatileTTLCache(_TTLExpiry, VolatileLRUCache):
     """TTL Cache with Volatile Keys.
 
     Items with the expire field set to "True"
@@ -900,148 +958,64 @@ class VolatileTTLCache(VolatileLRUCache):
         time (callable): Callable time function used by the
         cache.
     """
-    def __init__(self, capacity, ttl, callback=None, _time=time.monotonic):
-        VolatileLRUCache.__init__(self, capacity, callback)
+    __slots__ = ('_time', '_ttl', '_expiry', '_heap', '_seq')
 
-        self._time = _time
-        self.__ttl = ttl
+    _delete_expired = VolatileLRUCache.__delitem__
 
-        # Dict Mapping Keys to `_TTLLinks`
-        # this is primarily used for O(1)
-        # lookup and deletions of `_TTLLinks`
-        self._links = {}
-
-        # Linked List of '_TTLLinks'
-        # The linked list is 'sorted' in time-ascending
-        # order. The key with the nearest expiry time is
-        # at the front of the list.
-        self._list = _TTLLinkedList()
-
-    def expire(_time):
-        """Removes expired keys from the cache.
-
-        Decorator for class methods. Iterates over the linked
-        list and removes expired keys from the cache when
-        the cache is accessed.
-
-        """
-        def wrap(func):
-
-            def wrapped_f(self, *args):
-                curr = self._list.head
-
-                while curr:
-                    if curr.expiry <= _time():
-                        VolatileLRUCache.__delitem__(self, curr.key)
-                        self._list.remove(curr)
-                        del self._links[curr.key]
-                        curr = curr.next
-                    else:
-                        return func(self, *args)
+    def __init__(self, capacity, ttl, callback=None, _time=time.monotonic):
+        VolatileLRUCache.__init__(self, capacity, callback)
 
-                return func(self, *args)
-            return wrapped_f
-        return wrap
+        _TTLExpiry._init_expiry(self, _time, ttl)
 
-    @expire(_time=time.monotonic)
     def __setitem__(self, _keymeta, _value):
         _key, expires = _keymeta
 
+        now = self._time()
+        heap = self._heap
+        if heap and heap[0][0] <= now: # Something has expired
+            self._purge(now)
+
         VolatileLRUCache.__setitem__(self, _keymeta, _value)
-        try:
-            link = self._links[_key]
-        except KeyError:
-            if expires:
-                expiry = self._time() + self.__ttl
-                self._links[_key] = link = _TTLLink(_key, expiry, None, None)
-        else:
-            self._list.remove(link)
-            expiry = self._time() + self.__ttl
-            link.expiry = expiry
 
-        if expires:
-            self._list.insert(link)
+        if not expires:
+            self._expiry.pop(_key, None)
+        elif VolatileCache.__contains__(self, _key): # Otherwise, new data was discarded
+            self._set_expiry(_key, now + self._ttl)
 
-    @expire(_time=time.monotonic)
     def __getitem__(self, _key):
-        try:
-            _value = VolatileLRUCache.__getitem__(self, _key)
-        except KeyError:
-            raise KeyError(f"{_key}") from None
-        else:
-            return _value
-
-    @expire(_time=time.monotonic)
-    def get(self, _key, _default=None):
-        try:
-            return self[_key]
-        except KeyError:
-            return _default
+        self._expire()
+        return VolatileLRUCache.__getitem__(self, _key)
 
-    @expire(_time=time.monotonic)
     def __delitem__(self, _key):
-        try:
-            VolatileLRUCache.__delitem__(self, _key)
-        except KeyError:
-            raise KeyError(f"{_key}") from None
-        else:
-            if _key in self._links:
-                link = self._links[_key]
-                self._list.remove(link)
-                del self._links[_key]
+        self._expire()
+        VolatileLRUCache.__delitem__(self, _key)
+        self._expiry.pop(_key, None)
 
-    @expire(_time=time.monotonic)
     def __contains__(self, _object: object):
+        self._expire()
         return VolatileLRUCache.__contains__(self, _object)
 
-    @expire(_time=time.monotonic)
     def __iter__(self):
+        self._expire()
         return VolatileLRUCache.__iter__(self)
 
-    @expire(_time=time.monotonic)
     def __len__(self):
+        self._expire()
         return VolatileCache.__len__(self)
 
-    def _evict(self):
-        """Handle evictions when Cache exceeds capacity.
-        Not time-related.
-
-        Invokes callback function whenever an item is evicted.
-
-        """
-        # Fetch and Evict LRU Item from LRUCache
-        _key, _value = VolatileLRUCache.popitem(self)
-
-        # Remove References to Link
-        if _key in self._links:
-            link = self._links[_key]
-            self._list.remove(link)
-            del self._links[_key]
-
-        if self._callback:
-            self._callback(_key, _value)
-
-    @expire(_time=time.monotonic)
     def __str__(self):
+        self._expire()
         return VolatileLRUCache.__repr__(self)
 
     def popitem(self):
         """Evict the LRU item.
 
+        Called by `VolatileLRUCache._evict` when the
+        cache exceeds capacity. Not time-related.
         """
-        # Fetch and Evict LRU Item from LRUCache
         _key, _value = VolatileLRUCache.popitem(self)
-
-        # Remove References to Link
-        if _key in self._list:
-            link = self._links[_key]
-            self._list.remove(link)
-            del self._links[_key]
-
-    # Enable 'expire' decorator to be accessed
-    # outside of the scope of the class, while
-    # still being inside the class namespace.
-    expire = staticmethod(expire)
+        self._expiry.pop(_key, None)
+        return (_key, _value)
 
 
 class VTTLCache(TTLCache):
@@ -1058,105 +1032,23 @@ class VTTLCache(TTLCache):
         time (callable): Callable time function used by the
         cache.
     """
+    __slots__ = ()
+
     def __init__(self, capacity, callback=None, _time=time.monotonic):
         TTLCache.__init__(self, capacity, ttl=None, callback=callback, _time=_time)
-        self.__rep = [] # List Representation of the Linked List
 
-    @TTLCache.expire(_time=time.monotonic)
     def __setitem__(self, _keymeta, _value):
         _key, ttl = _keymeta
 
-        LRUCache.__setitem__(self, _key, _value)
-        try:
-            link = self._links[_key]
-        except KeyError:
-            expiry = self._time() + ttl
-            self._links[_key] = link = _TTLLink(_key, expiry, None, None)
-        else:
-            self._list.remove(link)
-            self.__rep.remove(link)
-            expiry = self._time() + ttl
-            link.expiry = expiry # Update Expiry Time Before Re-Insertion
+        now = self._time()
+        heap = self._heap
+        if heap and heap[0][0] <= now: # Something has expired
+            self._purge(now)
 
-        self.__insert(link, expiry, _key)
-
-    def _evict(self):
-        """Handle evictions when Cache exceeds capacity.
-        Not time-related.
-
-        Invokes callback function whenever an item is evicted.
-
-        """
-        # Fetch and Evict LRU Item from LRUCache
-        _key, _value = LRUCache.popitem(self)
-
-        # Remove References to Link
-        link = self._links[_key]
-        self.__rep.remove(link)
-        self._list.remove(link)
-        del self._links[_key]
-
-        if self._callback:
-            self._callback(_key, _value)
-
-    def __binary_search(self, expiry):
-        """Binary searches the list of TTL nodes.
-
-        Returns a tuple containing indexes used for insertion
-        to the linked list and list representation.
-
-        Args:
-            expiry (int): item expiry time.
-
-        Returns:
-            int, int: Previous link reference index, list
-            insertion reference index.
-        """
-        left = 0
-        right = tail = len(self.__rep) - 1
-        head = (0, 0)
-
-        while left <= right:
-            mid = (right + left) // 2
-
-            if self.__rep[mid].expiry < expiry:
-                if mid == tail:
-                    return mid, mid + 1
-                if self.__rep[mid + 1].expiry >= expiry:
-                    return mid, mid + 1
-                left += 1
-
-            elif self.__rep[mid].expiry > expiry:
-                if mid == 0:
-                    return head
-                if self.__rep[mid - 1].expiry <= expiry:
-                    return mid, mid
-                right -= 1
-
-            else:
-                return mid, mid
-
-        return head
-
-    def __insert(self, link, expiry, _key):
-        """Handle Insertions of Link to the Linked List
-        and List Representation.
-
-        Args:
-            link (_TTLLink): Link to insert.
-            expiry (int): Expiry time.
-            _key (hashable): Item Key.
-
-        """
-        node_index, list_index = self.__binary_search(expiry)
-
-        if self.__rep:
-            prev_link = self.__rep[node_index]
-        else:
-            prev_link = None
-
-        self._list.sorted_insert(prev_link, link)
-        self.__rep.insert(list_index, link)
+        LRUCache.__setitem__(self, _key, _value)
+        # The expiry heap orders items by expiry time,
+        # so items with different TTL's need no sorted insert.
+        self._set_expiry(_key, now + ttl)
 
 
 class BoundedTTLCache(TTLCache):
@@ -1165,6 +1057,9 @@ class BoundedTTLCache(TTLCache):
     Item TTL's are randomly generated between
     `ttl_min` and `ttl_max`. Range: [ttl_min, ttl_max].
 
+    TTL's are drawn in batches. Changing either bound
+    discards the TTL's drawn with the old bounds.
+
     Attributes:
         capacity (int): Maximum capacity of the cache.
         ttl_min (int): TTL minimum value.
@@ -1175,25 +1070,76 @@ class BoundedTTLCache(TTLCache):
         time (callable): Callable time function used by the
         cache.
     """
+    __slots__ = ('_ttl_min', '_ttl_max', '_ttls')
+
     def __init__(self, capacity, ttl_min, ttl_max, callback=None, _time=time.monotonic):
         TTLCache.__init__(self, capacity, None, callback, _time)
         # TTL Bounds
-        self.ttl_min = ttl_min
-        self.ttl_max = ttl_max
+        self._ttl_min = ttl_min
+        self._ttl_max = ttl_max
 
-    @TTLCache.expire(_time=time.monotonic)
-    def __setitem__(self, _key, _value):
-        LRUCache.__setitem__(self, _key, _value)
-        try:
-            link = self._links[_key]
-        except KeyError:
-            ttl = random.randrange(self.ttl_min, self.ttl_max + 1)
-            expiry = self._time() + ttl
-            self._links[_key] = link = _TTLLink(_key, expiry, None, None)
+        # Iterator over pre-drawn TTL's.
+        self._ttls = iter(())
+
+    @property
+    def ttl_min(self):
+        return self._ttl_min
+
+    @ttl_min.setter
+    def ttl_min(self, ttl_min):
+        self._ttl_min = ttl_min
+        self._ttls = iter(())
+
+    @property
+    def ttl_max(self):
+        return self._ttl_max
+
+    @ttl_max.setter
+    def ttl_max(self, ttl_max):
+        self._ttl_max = ttl_max
+        self._ttls = iter(())
+
+    def _draw_ttls(self):
+        """Draw the next batch of random TTL's.
+
+        A batch holds `_TTL_BATCH` TTL's, or one per item
+        the cache can hold if its capacity is smaller.
+
+        A single `random.choices` call draws the whole batch,
+        which is cheaper per TTL than a `randrange` call per item.
+        If the range holds a power of two TTL's, up to 256, each
+        TTL is a masked byte of a single `getrandbits` call.
+
+        Raises:
+            ValueError: `ttl_min` is greater than `ttl_max`.
+        """
+        ttl_min = self._ttl_min
+        span = self._ttl_max - ttl_min + 1
+
+        if span <= 0:
+            raise ValueError("ttl_min {} is greater than ttl_max {}".format(ttl_min, self._ttl_max))
+
+        batch = max(min(_TTL_BATCH, self._capacity), 1)
+
+        if span <= 256 and not span & (span - 1):
+            # The mask keeps the low bits of each byte, which
+            # are uniform over the span since it divides 256.
+            mask = span - 1
+            data = random.getrandbits(8 * batch).to_bytes(batch, "little")
+            self._ttls = iter([ttl_min + (byte & mask) for byte in data])
         else:
-            self._list.remove(link)
-            ttl = random.randrange(self.ttl_min, self.ttl_max + 1)
-            expiry = self._time() + ttl
-            link.expiry = expiry
+            self._ttls = iter(random.choices(range(ttl_min, ttl_min + span), k=batch))
 
-        self._list.insert(link)
+    def __setitem__(self, _key, _value):
+        ttl = next(self._ttls, None)
+        if ttl is None:
+            self._draw_ttls()
+            ttl = next(self._ttls)
+
+        now = self._time()
+        heap = self._heap
+        if heap and heap[0][0] <= now: # Something has expired
+            self._purge(now)
+
+        LRUCache.__setitem__(self, _key, _value)
+        self._set_expiry(_key, now + ttl)
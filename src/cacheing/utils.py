@@ -1,118 +1,42 @@
 """
-Library containing various doubly linked list implementations intended to
-be used with the cache's.
+Library containing the linked list implementation used by the LFU cache's.
 """
-from collections import OrderedDict
 
 
-class _TTLLink:
-    """Link in TTL Doubly Linked List.
+class LFUItem:
+    """Item link in the circular item list of an `LFUNode`.
 
-    Attributes:
-        key (hashable): Cache Item Key.
-        expiry (int): Item Expiry Time.
-        next (_TTLLink): Next Link in the DLL.
-        prev (_TTLLink): Prev Link in the DLL. None
-        if no previous link exists.
-    """
-    def __init__(self, key=None, expiry=None, nxt=None, prev=None):
-        self.key = key
-        self.expiry = expiry
-        self.next = nxt
-        self.prev = prev
-
-
-class _TTLLinkedList:
-    """Doubly Linked List of TTL Links.
+    Items link to their neighbours and to their parent
+    frequency node, so moving an item between frequency
+    nodes is a constant number of pointer updates.
 
-    Attributes:
-        head (_TTLLink): Head of the Linked List.
+    Args:
+        key (hashable): Item Key.
+        parent (LFUNode): Parent `LFUNode`.
     """
-    def __init__(self, head=None) -> None:
-        self.__head = head
-        # 'TTLCache' only inserts at the end of the
-        # list. Reference to the tail of the list
-        # for O(1) insertions.
-        self.__tail = head
-
-    @property
-    def head(self):
-        """Returns the head of the linked list."""
-        return self.__head
-
-    def insert(self, link):
-        """Insert a new link at the end of the linked list.
-
-        Args:
-            link (_TTLLink): `_TTLLink` to insert.
-        """
-        if self.__head:
-            link.prev = self.__tail
-            link.prev.next = self.__tail = link
-        else:
-            self.__head = self.__tail = link
-
-    def remove(self, link):
-        """Remove a link from the linked list.
-
-        Args:
-            link (_TTLLink): `_TTLLink` to remove.
-        """
-        if self.__head == link:
-            self.__head = self.__head.next
-        elif self.__tail == link:
-            self.__tail = self.__tail.prev
-        else:
-            link.prev.next = link.next
-            link.next.prev = link.prev
-
-    def sorted_insert(self, prev_link, link):
-        """Sorted insert into the VTTL Linked List.
-
-        Because VTTL cache items have variable
-        time-to-lives, the VTTL Linked List is sorted
-        in ascending order by expiry time.
+    __slots__ = ['key', 'parent', 'prev', 'next']
 
-        'prev_link' is determined by performing a binary
-        search on the list represenation of the linked list.
-        'prev_link' is the pivot link where link will be inserted.
-
-        Args:
-            prev_link (_TTLLink): pivot link where link will be inserted.
-            link (_TTLLink): link to insert.
-        """
-        if not prev_link:
-            self.__head = self.__tail = link
-            return
-
-        if prev_link.expiry <= link.expiry:
-            link.next = prev_link.next
-            link.prev = prev_link
-            prev_link.next = link
-
-            if self.__tail == prev_link:
-                self.__tail = link
-
-        else:
-            link.next = prev_link
-            link.prev = prev_link.prev
-            prev_link.prev = link
-
-            if self.__head == prev_link:
-                self.__head = link
+    def __init__(self, key=None, parent=None):
+        self.key = key
+        self.parent = parent
+        # An unlinked item is a list of its own,
+        # which is how a sentinel starts out.
+        self.prev = self
+        self.next = self
 
 
 class LFUNode:
-    """Object representing each item in the LFU cache.
+    """Frequency node in the LFU linked list.
 
-    Each `LFUNode` contains its value and
-    a pointer to its parent frequency node
-    in the linked list.
+    Each `LFUNode` holds the items accessed `frequency`
+    times in a circular list bounded by a sentinel
+    `LFUItem`. Items are kept in insertion order: the
+    oldest item follows the sentinel.
 
     Args:
-        key (hashable): Item Key.
-        value (object): Item Value.
-        parent (_LFUFreqNode): Parent `_LFUFreqNode.`
+        frequency (int): Access frequency of the node's items.
+        prev (LFUNode): Prev node in the DLL.
+        next (LFUNode): Next node in the DLL.
     """
     __slots__ = ['frequency', 'prev', 'next', 'items']
 
@@ -120,17 +44,69 @@ class LFUNode:
         self.frequency = frequency
         self.prev = prev
         self.next = next
-        self.items = OrderedDict()
+        self.items = LFUItem() # Sentinel
 
 
 class LFULinkedList:
     """Doubly linked list of `LFUNode` objects. """
 
-    __slots__ = ['head', 'node_cache']
+    __slots__ = ['head', 'min_node', 'node_cache']
 
     def __init__(self):
         self.head = LFUNode(frequency=0) # Dummy Head
-        self.node_cache = {} # Mapping Keys -> LFULinkedList Nodes
+        # No node before `min_node` holds any items,
+        # so evictions start searching from it.
+        self.min_node = None
+        self.node_cache = {} # Mapping Keys -> LFUItems
+
+    def __getstate__(self):
+        """Returns the frequency and keys of each node.
+
+        Items link to each other, so pickling them directly
+        recurses once per item. Keys are listed in item order,
+        and empty nodes are kept, so the rebuilt list evicts
+        in the same order.
+        """
+        state = []
+        node = self.head.next
+        while node:
+            root = node.items
+            keys = []
+            item = root.next
+            while item is not root:
+                keys.append(item.key)
+                item = item.next
+            state.append((node.frequency, keys))
+            node = node.next
+
+        return state
+
+    def __setstate__(self, state):
+        """Rebuilds the nodes, items and node cache.
+
+        Args:
+            state (list): (frequency, keys) of each node.
+        """
+        LFULinkedList.__init__(self)
+        node_cache = self.node_cache
+
+        prev = self.head
+        for frequency, keys in state:
+            node = LFUNode(frequency=frequency, prev=prev)
+            prev.next = node
+
+            root = node.items
+            for key in keys:
+                item = LFUItem(key, node)
+                last = root.prev
+                last.next = root.prev = item
+                item.prev = last
+                item.next = root
+                node_cache[key] = item
+
+            prev = node
+
+        self.min_node = self.head.next
 
     def insert(self, key):
         """Create and Insert a new item into the DLL.
@@ -141,70 +117,91 @@ class LFULinkedList:
         it's value and access frequency is updated in an outer scope.
 
         Args:
-            _key (hashable): Item Key.
-            _value (object): Item Value.
+            key (hashable): Item Key.
         """
         head = self.head
         if not head.next:
             node = LFUNode(frequency=1, prev=head, next=None)
             head.next = node
 
-        node = head.next
-        node.items[key] = None
-        self.node_cache[key] = node
+        node = self.min_node = head.next
+        item = LFUItem(key, node)
+
+        root = node.items
+        last = root.prev
+        last.next = root.prev = item
+        item.prev = last
+        item.next = root
+
+        self.node_cache[key] = item
 
-    #@profile
     def increment(self, key):
-        """Update the Access-Frequency of a Node.
+        """Update the Access-Frequency of an item.
 
         When an item in the cache is accessed, it's
         corresponding access frequency is incremented
         from N to N+1.
         If a frequency node with frequency N+1 exists,
-        we move the _LFUNode to the new frequency list.
+        we move the item to the new frequency list.
         If no frequency node exists with frequency N+1,
         we create the node, insert it into the linked list,
-        and then move the node to this new frequency list.
+        and then move the item to this new frequency list.
 
         Args:
-            node (_LFUNode): `_LFUNode` to access.
+            key (hashable): Item Key.
         """
-        node = self.node_cache[key] # 14.4%
-        del node.items[key] # 18.7%
-        #node_next = node.next # 10.5%
-
-        if node.next and node.next.frequency == node.frequency+1: # 11.8%
-            node.next.items[key] = None # 16.5%
-        else:
-            new_node = LFUNode(frequency=node.frequency+1, prev=node, next=node.next)
-            new_node.items[key] = None
-            node.next = new_node
-
-        self.node_cache[key] = node.next # 15.0%
+        item = self.node_cache[key]
+        node = item.parent
+
+        # Unlink from the current frequency list.
+        item.prev.next = item.next
+        item.next.prev = item.prev
+
+        nxt = node.next
+        if not nxt or nxt.frequency != node.frequency + 1:
+            nxt = LFUNode(frequency=node.frequency + 1, prev=node, next=nxt)
+            if node.next:
+                node.next.prev = nxt
+            node.next = nxt
+
+        # Link at the end of the next frequency list.
+        item.parent = nxt
+        root = nxt.items
+        last = root.prev
+        last.next = root.prev = item
+        item.prev = last
+        item.next = root
+
+        # The item moved past an emptied minimum node.
+        if node is self.min_node and node.items.next is node.items:
+            self.min_node = nxt
 
     def delete(self, key):
         """Delete key from the linked list. """
-        node = self.node_cache[key]
-        del node.items[key]
-        del self.node_cache[key]
+        item = self.node_cache.pop(key)
+        item.prev.next = item.next
+        item.next.prev = item.prev
 
     def popleft(self):
         """Evicts least-frequently used item from the cache.
 
         Removes all references to the least-frequently
-        used `_LFUNode` from the `_LFUList` cache and linked lists.
+        used `LFUItem` from the node cache and linked lists.
 
         Returns:
-            node.key (hashable): Item Key.
-            node.value (object): Item Value.
+            key (hashable): Item Key.
 
         """
-        curr = self.head.next
+        curr = self.min_node
         while curr:
-            if curr.items:
-                key, _ = curr.items.popitem(False)
-                del self.node_cache[key]
-                return key
+            root = curr.items
+            item = root.next
+            if item is not root:
+                root.next = item.next
+                item.next.prev = root
+                del self.node_cache[item.key]
+                self.min_node = curr
+                return item.key
             curr = curr.next
 
         raise KeyError("cannot pop from empty cache.")
@@ -1,6 +1,7 @@
 from src.cacheing import BoundedTTLCache
 
 import asyncio
+import pickle
 from unittest import IsolatedAsyncioTestCase
 
 
@@ -57,4 +58,48 @@ class TestBoundedCache(IsolatedAsyncioTestCase):
         cache = BoundedTTLCache(capacity=-1, ttl_min=1, ttl_max=2)
 
         with self.assertRaises(KeyError):
-            cache[2] = 3
\ No newline at end of file
+            cache[2] = 3
+
+    def test_ttl_bounds(self):
+        cache = BoundedTTLCache(capacity=2000, ttl_min=1, ttl_max=3, _time=lambda: 0)
+
+        for i in range(2000):
+            cache[i] = i
+
+        self.assertEqual({1, 2, 3}, set(cache._expiry.values()))
+
+    def test_ttl_bounds_power_of_two(self):
+        cache = BoundedTTLCache(capacity=2000, ttl_min=1, ttl_max=4, _time=lambda: 0)
+
+        for i in range(2000):
+            cache[i] = i
+
+        self.assertEqual({1, 2, 3, 4}, set(cache._expiry.values()))
+
+    def test_ttl_bounds_change(self):
+        cache = BoundedTTLCache(capacity=10, ttl_min=1, ttl_max=2, _time=lambda: 0)
+        cache[1] = 2
+
+        cache.ttl_min = cache.ttl_max = 100
+        cache[2] = 3
+
+        self.assertEqual(100, cache._expiry[2])
+
+    def test_ttl_bounds_change_raises(self):
+        cache = BoundedTTLCache(capacity=10, ttl_min=1, ttl_max=2)
+        cache[1] = 2
+
+        cache.ttl_min = 10
+
+        with self.assertRaises(ValueError):
+            cache[2] = 3
+
+    def test_pickle(self):
+        for i in range(5):
+            self.cache[i] = i + 1
+
+        cache = pickle.loads(pickle.dumps(self.cache))
+
+        self.assertEqual(self.cache._expiry, cache._expiry)
+        self.assertEqual(list(self.cache.items()), list(cache.items()))
+        self.assertEqual(self.cache.popitem(), cache.popitem())
@@ -1,5 +1,7 @@
 # pylint: skip-file
 
+import copy
+import pickle
 import unittest
 from unittest.mock import Mock
 from collections import Counter
@@ -104,4 +106,36 @@ class TestLFUCache(unittest.TestCase):
         cache = LFUCache(capacity=6, callback=None)
         
         self.assertRaises(KeyError, lambda: cache.popitem())
-        
\ No newline at end of file
+        
+    def test_lfu_delete_least_frequent(self):
+        for key in (2, 3, 4, 5):
+            self.cache[key]
+        self.cache[3]
+
+        del self.cache[1]
+
+        k, v = self.cache.popitem()
+        self.assertEqual(k, 2)
+
+        self.cache[6] = 7
+
+        k, v = self.cache.popitem()
+        self.assertEqual(k, 6)
+
+    def test_lfu_pickle(self):
+        cache = LFUCache(capacity=1500)
+        for i in range(1500):
+            cache[i] = i
+            for _ in range(i % 4):
+                cache[i]
+
+        pickled = pickle.loads(pickle.dumps(cache))
+        copied = copy.deepcopy(cache)
+
+        for restored in (pickled, copied):
+            self.assertIs(restored.node_cache, restored._lfu.node_cache)
+            self.assertEqual(restored, cache)
+
+        expected = [cache.popitem() for _ in range(1500)]
+        self.assertEqual([pickled.popitem() for _ in range(1500)], expected)
+        self.assertEqual([copied.popitem() for _ in range(1500)], expected)
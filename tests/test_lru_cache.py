@@ -116,3 +116,14 @@ class TestLRUCache(unittest.TestCase):
         eqcache[4] = 5
 
         self.assertNotEqual(cache, eqcache)
+
+    def test_repr_lru_order(self):
+        cache = LRUCache(capacity=2)
+
+        cache[1] = 2
+        cache[2] = 3
+        cache[2]
+        cache[1]
+        cache[3] = 4
+
+        self.assertEqual(repr(cache), "LRUCache{1: 2, 3: 4}")
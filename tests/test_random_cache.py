@@ -65,4 +65,10 @@ class TestRandomCache(unittest.TestCase):
         self.assertIn(3, self.cache)
         self.assertIn(4, self.cache)
         self.assertIn(5, self.cache)
-        self.assertIn(6, self.cache)
\ No newline at end of file
+        self.assertIn(6, self.cache)
+
+    def test_popitem_empty_cache(self):
+        cache = RandomCache(capacity=2)
+
+        with self.assertRaises(KeyError):
+            cache.popitem()
@@ -1,6 +1,7 @@
 # pylint: skip-file
 
 import unittest
+import weakref
 
 from typing import ItemsView, KeysView, ValuesView
 
@@ -152,6 +153,13 @@ class TestRCache(unittest.TestCase):
 
         self.assertNotEqual(cache, eqcache)
 
+    def test_object_equivalence_capacity(self):
+        self.assertNotEqual(RCache(capacity=10), RCache(capacity=11))
+
+    def test_no_instance_dict(self):
+        with self.assertRaises(AttributeError):
+            self.cache.foo = 1
+
     def test_cache_size(self):
         self.assertEqual(len(self.cache), 4)
 
@@ -176,4 +184,9 @@ class TestRCache(unittest.TestCase):
         cache = RCache(capacity=10)
         with self.assertRaises(KeyError):
             cache._evict()
-    
\ No newline at end of file
+
+    def test_weak_reference(self):
+        cache = RCache(capacity=10)
+        ref = weakref.ref(cache)
+
+        self.assertIs(ref(), cache)
@@ -1,6 +1,7 @@
 from src.cacheing import TTLCache
 
 import asyncio
+import pickle
 from unittest import IsolatedAsyncioTestCase
 
 
@@ -105,7 +106,7 @@ class TestTTLCache(IsolatedAsyncioTestCase):
         self.cache[1] = 3
         self.cache[2] = 4
         
-        self.assertEqual(3, self.cache._list.head.key)
+        self.assertEqual(3, min(self.cache._expiry, key=self.cache._expiry.get))
 
         await asyncio.sleep(1) # Some Task
 
@@ -125,11 +126,28 @@ class TestTTLCache(IsolatedAsyncioTestCase):
         self.cache[5] = 6
         self.cache[6] = 7
 
-        self.assertEqual(1, self.cache._list.head.key)
+        self.assertEqual(1, min(self.cache._expiry, key=self.cache._expiry.get))
 
         del self.cache[1]
         del self.cache[2]
 
         self.assertNotIn(1, self.cache)
         self.assertNotIn(2, self.cache)
-        self.assertEqual(3, self.cache._list.head.key)
\ No newline at end of file
+        self.assertEqual(3, min(self.cache._expiry, key=self.cache._expiry.get))
+
+    def test_reset_key_heap_bounded(self):
+        for i in range(100):
+            self.cache[1] = i
+
+        self.assertEqual(99, self.cache[1])
+        self.assertLessEqual(len(self.cache._heap), 2)
+
+    def test_pickle(self):
+        for i in range(5):
+            self.cache[i] = i + 1
+
+        cache = pickle.loads(pickle.dumps(self.cache))
+
+        self.assertEqual(self.cache._expiry, cache._expiry)
+        self.assertEqual(list(self.cache.items()), list(cache.items()))
+        self.assertEqual(self.cache.popitem(), cache.popitem())
@@ -1,6 +1,7 @@
 # pylint: skip-file
 
 import unittest
+import weakref
 from unittest.mock import Mock
 
 from typing import ItemsView, KeysView, ValuesView
@@ -164,6 +165,14 @@ class TestVolatileCache(unittest.TestCase):
 
         self.assertNotEqual(cache, eqcache)
 
+    def test_object_equivalence_identity(self):
+        self.assertEqual(self.cache, self.cache)
+        self.assertNotEqual(self.cache, dict(self.cache.items()))
+
+    def test_unhashable(self):
+        with self.assertRaises(TypeError):
+            hash(self.cache)
+
     def test_cache_size(self):
         self.assertEqual(len(self.cache), 5)
 
@@ -177,4 +186,10 @@ class TestVolatileCache(unittest.TestCase):
 
     def test_cache_popitem_size_update(self):
         self.cache.popitem()
-        self.assertEqual(len(self.cache), 4)
\ No newline at end of file
+        self.assertEqual(len(self.cache), 4)
+
+    def test_weak_reference(self):
+        cache = VolatileCache(capacity=10)
+        ref = weakref.ref(cache)
+
+        self.assertIs(ref(), cache)
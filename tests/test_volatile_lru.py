@@ -47,6 +47,16 @@ class TestVolatileLRUCache(unittest.TestCase):
         k, v = cache.popitem()
         self.assertEqual(k, 1)
 
+    def test_get_item_lru_update_falsy_value(self):
+        cache = VolatileLRUCache(capacity=6, callback=None)
+
+        cache[1, True] = 0
+        cache[2, True] = 3
+
+        cache[1]
+        k, v = cache.popitem()
+        self.assertEqual(k, 2)
+
     def test_lru_set_item_lru_update(self):
         self.cache[6, True] = 7
 
@@ -131,4 +141,26 @@ class TestVolatileLRUCache(unittest.TestCase):
         cache[3, False] = 4
 
         with self.assertRaises(KeyError):
-            cache.popitem()
\ No newline at end of file
+            cache.popitem()
+
+    def test_delete_persistent_key(self):
+        cache = VolatileLRUCache(capacity=3)
+
+        cache[1, False] = 2
+        cache[2, True] = 3
+        del cache[1]
+
+        self.assertNotIn(1, cache)
+        self.assertEqual(cache.popitem(), (2, 3))
+
+    def test_discarded_item_is_not_evicted(self):
+        cache = VolatileLRUCache(capacity=2)
+
+        cache[1, False] = 2
+        cache[2, False] = 3
+        cache[3, True] = 4 # Discarded, no candidate keys
+
+        del cache[1]
+        cache[4, True] = 5
+
+        self.assertEqual(cache.popitem(), (4, 5))
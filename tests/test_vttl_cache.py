@@ -1,6 +1,7 @@
 from src.cacheing import VTTLCache
 
 import time
+import pickle
 import asyncio
 from unittest import IsolatedAsyncioTestCase
 
@@ -108,3 +109,32 @@ class TestVTTLCache(IsolatedAsyncioTestCase):
 
     def test_float_expiry(self):
         return
+
+    def test_reset_key_ttl(self):
+        now = [0]
+        cache = VTTLCache(capacity=4, _time=lambda: now[0])
+
+        cache[1, 10] = 2
+        cache[2, 5] = 3
+        cache[1, 1] = 4 # Shorter TTL
+
+        now[0] = 2
+
+        self.assertNotIn(1, cache)
+        self.assertIn(2, cache)
+
+        cache[2, 10] = 5 # Longer TTL
+
+        now[0] = 6
+
+        self.assertEqual(cache.get(2), 5)
+
+    def test_pickle(self):
+        for i in range(5):
+            self.cache[i, 10 - i] = i + 1
+
+        cache = pickle.loads(pickle.dumps(self.cache))
+
+        self.assertEqual(self.cache._expiry, cache._expiry)
+        self.assertEqual(list(self.cache.items()), list(cache.items()))
+        self.assertEqual(self.cache.popitem(), cache.popitem())